@@ -1,5 +1,14 @@
-import csv, io, re, datetime
-from typing import List, Dict, Any
+# csv/io/datetime are imported inside the parser to keep module import light
+import re
+from typing import List, Dict, Any, Iterator
+
+_SUPERS = "⁰¹²³⁴⁵⁶⁷⁸⁹"
+# Compiled once; used for every scaled column on large steel tables
+_UNIT_RE = re.compile(r"x\s*10\s*\^?\s*([0-9]+)|x10([⁰¹²³⁴⁵⁶⁷⁸⁹])")
+
+# Memoised helper results, shared across CSVs parsed in one process
+_SCALE_CACHE: Dict[tuple, float] = {}
+_ROW_FN_CACHE: Dict[tuple, Any] = {}
 
 def _scale_from_units(hdr: str, unit: str) -> float:
     """
@@ -11,18 +20,25 @@ def _scale_from_units(hdr: str, unit: str) -> float:
     """
     if not unit:
         return 1.0
+    key = (hdr.strip().lower(), unit)
+    v = _SCALE_CACHE.get(key)
+    if v is None:
+        v = _SCALE_CACHE[key] = _parse_scale(key[0], unit)
+    return v
+
+def _parse_scale(hdr: str, unit: str) -> float:
+    # hdr is already stripped/lowercased by _scale_from_units
     # Try to read the "x10^n" part, accepting superscripts or normal digits
-    m = re.search(r"x\s*10\s*[\^]?\s*([0-9]+)|x10([⁰¹²³⁴⁵⁶⁷⁸⁹])", unit)
+    m = _UNIT_RE.search(unit)
     if m:
         if m.group(1):
             return 10 ** int(m.group(1))
         # Superscript fallback (rare if CSV preserved it)
-        supers = "⁰¹²³⁴⁵⁶⁷⁸⁹"
-        return 10 ** supers.index(m.group(2))
+        return 10 ** _SUPERS.index(m.group(2))
     # Heuristics if the exponent was lost:
-    if hdr.strip().lower() in ("ix", "iy"):
+    if hdr in ("ix", "iy"):
         return 1e6
-    if hdr.strip().lower() in ("zx", "zy", "sx", "sy"):
+    if hdr in ("zx", "zy", "sx", "sy"):
         return 1e3
     return 1.0
 
@@ -34,7 +50,8 @@ def _num(s: str):
         return None
     t = t.replace(",", "")
     try:
-        if re.fullmatch(r"[+-]?\d+", t):
+        # cheap int-vs-float test; this runs for every cell
+        if t.lstrip("+-").isdigit():
             return int(t)
         return float(t)
     except ValueError:
@@ -48,36 +65,34 @@ def _clean_designation(desc: str) -> str:
 
 def _type_from_designation(designation: str) -> str:
     # Extract letters in the middle: 610 UB 125 -> 'UB'; 310UC158 -> 'UC'
-    m = re.search(r"[A-Za-z]{2,3}", designation)
-    return m.group(0).upper() if m else ""
+    # First run of 2+ ASCII letters, capped at 3 (plain scan, no regex)
+    t = ""
+    i, n = 0, len(designation)
+    while i < n:
+        if designation[i].isascii() and designation[i].isalpha():
+            j = i + 1
+            while j < n and designation[j].isascii() and designation[j].isalpha():
+                j += 1
+            if j - i >= 2:
+                t = designation[i:min(j, i + 3)].upper()
+                break
+            i = j
+        else:
+            i += 1
+    return t
 
-def sections_csv_to_schema(
-    csv_text: str,
-    *,
-    source="Australian Steel Standards",
-    region="AU",
-    material="steel"
-) -> List[Dict[str, Any]]:
-    """
-    Convert the provided CSV (headers row, units row, then data) into the JSON schema:
-    {
-      source, region, material, type, designation,
-      dimensions: { d_mm, bf_mm, tf_mm, tw_mm, r_mm },
-      properties: { mass_kg_per_m, area_mm2, Ix_mm4, Iy_mm4, Zx_mm3, Zy_mm3, rx_mm, ry_mm, Sx_mm3, Sy_mm3 },
-      raw_data: { extracted_at: YYYY-MM-DD }
-    }
-    """
-    f = io.StringIO(csv_text.strip("\ufeff \n\r"))
-    rows = list(csv.reader(f))
-    # Drop fully blank rows
-    rows = [r for r in rows if any(c.strip() for c in r)]
-    if len(rows) < 3:
-        raise ValueError("Expected at least 3 rows (headers, units, data).")
+def _is_blank(row) -> bool:
+    return not any(c.strip() for c in row)
 
-    headers = [h.strip().strip('"') for h in rows[0]]
-    units   = [u.strip().strip('"') for u in rows[1]]
-    H = {i: h for i, h in enumerate(headers)}
+def _next_nonblank(reader):
+    # Advance past fully blank rows; None once the reader is exhausted
+    for row in reader:
+        if not _is_blank(row):
+            return row
+    return None
 
+def _column_plan(headers: List[str], units: List[str]):
+    """Resolve column indexes and unit scales for a header/unit row pair."""
     # helpful index helpers (first match wins)
     def idx_of(name: str) -> int:
         return next((i for i, h in enumerate(headers) if h == name), -1)
@@ -109,59 +124,153 @@ def sections_csv_to_schema(
             return 1.0
         return _scale_from_units(headers[idx], units[idx])
 
-    scale_Ix = scale_at(idx_Ix)
-    scale_Iy = scale_at(idx_Iy)
-    scale_Zx = scale_at(idx_Zx)
-    scale_Zy = scale_at(idx_Zy)
-    scale_Sx = scale_at(idx_Sx)
-    scale_Sy = scale_at(idx_Sy)
-
-    out: List[Dict[str, Any]] = []
-    today = datetime.date.today().isoformat()
-
-    for row in rows[2:]:
-        # pad/truncate row
-        if len(row) < len(headers):
-            row = row + [""] * (len(headers) - len(row))
-        elif len(row) > len(headers):
-            row = row[:len(headers)]
-
-        designation = _clean_designation(row[idx_desc] if idx_desc >= 0 else "")
-        typ = _type_from_designation(designation)
-
-        def val(idx):  # simple getter
-            return _num(row[idx]) if idx >= 0 else None
-
-        obj = {
-            "source": source,
-            "region": region,
-            "material": material,
-            "type": typ,
-            "designation": designation,
-            "dimensions": {
-                "d_mm":  val(idx_d),
-                "bf_mm": val(idx_bf),
-                "tf_mm": val(idx_tf),
-                "tw_mm": val(idx_tw),
-                "r_mm":  val(idx_r1),
-            },
-            "properties": {
-                "mass_kg_per_m": val(idx_W),
-                "area_mm2":      val(idx_Ag),
-                "Ix_mm4":  (val(idx_Ix) * scale_Ix) if val(idx_Ix) is not None else None,
-                "Iy_mm4":  (val(idx_Iy) * scale_Iy) if val(idx_Iy) is not None else None,
-                "Zx_mm3":  (val(idx_Zx) * scale_Zx) if val(idx_Zx) is not None else None,
-                "Zy_mm3":  (val(idx_Zy) * scale_Zy) if val(idx_Zy) is not None else None,
-                "rx_mm":   val(idx_rx),
-                "ry_mm":   val(idx_ry),
-                "Sx_mm3":  (val(idx_Sx) * scale_Sx) if val(idx_Sx) is not None else None,
-                "Sy_mm3":  (val(idx_Sy) * scale_Sy) if val(idx_Sy) is not None else None,
-            },
-            "raw_data": {
-                "extracted_at": today
-            }
-        }
-        out.append(obj)
+    # (out_key, column index, unit scale or None) built once, not per row
+    dim_cols = (
+        ("d_mm",  idx_d),
+        ("bf_mm", idx_bf),
+        ("tf_mm", idx_tf),
+        ("tw_mm", idx_tw),
+        ("r_mm",  idx_r1),
+    )
+    prop_cols = (
+        ("mass_kg_per_m", idx_W,  None),
+        ("area_mm2",      idx_Ag, None),
+        ("Ix_mm4",        idx_Ix, scale_at(idx_Ix)),
+        ("Iy_mm4",        idx_Iy, scale_at(idx_Iy)),
+        ("Zx_mm3",        idx_Zx, scale_at(idx_Zx)),
+        ("Zy_mm3",        idx_Zy, scale_at(idx_Zy)),
+        ("rx_mm",         idx_rx, None),
+        ("ry_mm",         idx_ry, None),
+        ("Sx_mm3",        idx_Sx, scale_at(idx_Sx)),
+        ("Sy_mm3",        idx_Sy, scale_at(idx_Sy)),
+    )
+    return idx_desc, dim_cols, prop_cols
 
-    return out
+def _compile_row_fn(idx_desc: int, dim_cols, prop_cols):
+    """
+    Generate a row -> record function with the column indexes and scales
+    written in as literals, so the per-row path has no index tables or -1 checks.
+    Short rows are still bounds-checked (missing cells read as None).
+    """
+    def cell(i):
+        return "(_num(row[%d]) if n > %d else None)" % (i, i) if i >= 0 else "None"
+
+    lines = [
+        "def _row_to_obj(row, source, region, material, raw_block):",
+        "    n = len(row)",
+        "    designation = _clean(%s)" % (
+            "row[%d] if n > %d else ''" % (idx_desc, idx_desc) if idx_desc >= 0 else "''"),
+    ]
+    props = []
+    for j, (k, i, sc) in enumerate(prop_cols):
+        if sc is None or i < 0:
+            props.append("%r: %s" % (k, cell(i)))
+        else:
+            lines.append("    v%d = %s" % (j, cell(i)))
+            props.append("%r: (None if v%d is None else v%d * %r)" % (k, j, j, sc))
+    dims = ["%r: %s" % (k, cell(i)) for k, i in dim_cols]
+    lines += [
+        "    return {",
+        "        'source': source, 'region': region, 'material': material,",
+        "        'type': _type(designation), 'designation': designation,",
+        "        'dimensions': {%s}," % ", ".join(dims),
+        "        'properties': {%s}," % ", ".join(props),
+        "        'raw_data': raw_block,",
+        "    }",
+    ]
+    ns = {"_num": _num, "_clean": _clean_designation, "_type": _type_from_designation}
+    exec(compile("\n".join(lines), "<sections_csv_row>", "exec"), ns)
+    return ns["_row_to_obj"]
+
+def sections_csv_to_schema(
+    csv_text,
+    *,
+    source="Australian Steel Standards",
+    region="AU",
+    material="steel"
+) -> List[Dict[str, Any]]:
+    """
+    Convert the provided CSV (headers row, units row, then data) into the JSON schema:
+    {
+      source, region, material, type, designation,
+      dimensions: { d_mm, bf_mm, tf_mm, tw_mm, r_mm },
+      properties: { mass_kg_per_m, area_mm2, Ix_mm4, Iy_mm4, Zx_mm3, Zy_mm3, rx_mm, ry_mm, Sx_mm3, Sy_mm3 },
+      raw_data: { extracted_at: YYYY-MM-DD }
+    }
+    `csv_text` may be the CSV as a string or an open text file.
+    All records share one `raw_data` dict; copy it before mutating.
+    """
+    return list(iter_sections_csv_to_schema(
+        csv_text, source=source, region=region, material=material))
+
+def iter_sections_csv_to_schema(
+    csv_text,
+    *,
+    source="Australian Steel Standards",
+    region="AU",
+    material="steel"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of `sections_csv_to_schema`: yields one record per data row
+    without holding the whole CSV in memory (e.g. to feed `BTreeDB.ingest_list`).
+    """
+    import csv, io, datetime
+    if isinstance(csv_text, str):
+        f = io.StringIO(csv_text.strip("\ufeff \n\r"))
+    else:
+        f = csv_text
+    reader = csv.reader(f)
+    header_row = _next_nonblank(reader)
+    unit_row = _next_nonblank(reader)
+    if header_row is None or unit_row is None:
+        raise ValueError("Expected at least 3 rows (headers, units, data).")
+    if header_row[0].startswith("\ufeff"):
+        header_row[0] = header_row[0][1:]
+
+    headers = [h.strip().strip('"') for h in header_row]
+    units   = [u.strip().strip('"') for u in unit_row]
+
+    # Specialised row parser, compiled once per header/unit layout
+    layout = (tuple(headers), tuple(units))
+    row_to_obj = _ROW_FN_CACHE.get(layout)
+    if row_to_obj is None:
+        row_to_obj = _ROW_FN_CACHE[layout] = _compile_row_fn(*_column_plan(headers, units))
 
+    n_rows = 0
+    # One read-only dict shared by every record (saves a dict per row)
+    raw_block = {"extracted_at": datetime.date.today().isoformat()}
+
+    for row in reader:
+        if _is_blank(row):
+            continue
+        n_rows += 1
+        yield row_to_obj(row, source, region, material, raw_block)
+
+    if not n_rows:
+        raise ValueError("Expected at least 3 rows (headers, units, data).")
+
+def sections_csv_to_soa(csv_text, **kwargs) -> Dict[str, Any]:
+    """
+    Column-oriented (structure-of-arrays) variant of `sections_csv_to_schema`.
+    Returns {"designations": [...], "type": [...], <key>: array('d'), ...} with one
+    array per dimension/property key (d_mm, ..., Sy_mm3), all indexed by row id.
+    Missing or non-numeric cells are stored as NaN. Much smaller than a list of
+    nested dicts when scanning one property across many sections.
+    """
+    from array import array
+    nan = float("nan")
+    designations: List[str] = []
+    types: List[str] = []
+    cols: List[tuple] = []  # (group, key, array) in output order
+    for obj in iter_sections_csv_to_schema(csv_text, **kwargs):
+        if not cols:
+            cols = [(g, k, array("d")) for g in ("dimensions", "properties") for k in obj[g]]
+        designations.append(obj["designation"])
+        types.append(obj["type"])
+        for g, k, arr in cols:
+            v = obj[g][k]
+            arr.append(v if isinstance(v, (int, float)) else nan)
+    out: Dict[str, Any] = {"designations": designations, "type": types}
+    for _, k, arr in cols:
+        out[k] = arr
+    return out
@@ -29,13 +29,53 @@ Notes
 -----
 - Keys are stored as bytes; strings are UTF‑8 encoded internally.
 - Values are stored as bytes with a 2‑byte type tag (e.g., b"i:") followed by data.
+- Floats are stored as 8‑byte IEEE754 (b"F:"); the older text form (b"f:") is still read.
+- Flat numeric records can be packed with `struct` instead of JSON by registering
+  a schema (see `register_schema`); other dicts fall back to JSON.
 - Call `flush()` to persist; context manager auto‑flushes and closes.
 """
 
+_json = None
+
+
+def _json_mod():
+    # json is only needed for dict/list/tuple values; import on first use
+    # to keep boot-time imports of this module light.
+    global _json
+    if _json is None:
+        try:
+            import ujson as mod
+        except Exception:  # pragma: no cover (desktop fallback)
+            import json as mod  # type: ignore
+        _json = mod
+    return _json
+
 try:
-    import ujson as json
+    import ustruct as struct
 except Exception:  # pragma: no cover (desktop fallback)
-    import json  # type: ignore
+    import struct  # type: ignore
+
+# ustruct has no struct.error; it raises ValueError instead
+_STRUCT_ERROR = getattr(struct, 'error', ValueError)
+
+# Value ranges for packed integer fields (standard sizes, '<' format)
+_INT_RANGES = {
+    'b': (-0x80, 0x7F), 'B': (0, 0xFF),
+    'h': (-0x8000, 0x7FFF), 'H': (0, 0xFFFF),
+    'i': (-0x80000000, 0x7FFFFFFF), 'I': (0, 0xFFFFFFFF),
+    'l': (-0x80000000, 0x7FFFFFFF), 'L': (0, 0xFFFFFFFF),
+    'q': (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF), 'Q': (0, 0xFFFFFFFFFFFFFFFF),
+}
+_FLOAT_FMT = '<d'  # 8-byte IEEE754, little-endian
+
+
+# Tag-specific decoders used by the typed getters (tag already checked)
+def _dec_int(raw):
+    return int(raw[2:])
+
+
+def _dec_str(raw):
+    return raw[2:].decode('utf-8')
 
 
 class BTreeDB:
@@ -55,11 +95,13 @@ class BTreeDB:
 
     # Type tags (1 char + ':') kept short to reduce storage overhead
     _T_INT = b"i:"
-    _T_FLOAT = b"f:"
+    _T_FLOAT = b"F:"      # binary double
+    _T_FLOAT_TXT = b"f:"  # legacy repr() text; decoded only
     _T_STR = b"s:"
     _T_DICT = b"d:"
     _T_LIST = b"l:"
     _T_TUPLE = b"t:"
+    _T_PACK = b"p:"
 
     def __init__(self, path='data.db', *, pagesize=0, cache_size=0, minkeypage=0,
                  autosync=False, key_prefix=None):
@@ -68,10 +110,23 @@ class BTreeDB:
         self.cache_size = cache_size
         self.minkeypage = minkeypage
         self.autosync = autosync
-        self.key_prefix = key_prefix
+        self.key_prefix = key_prefix  # also sets the encoded _prefix_b
 
         self._f = None
         self._db = None
+        # Packed-record schemas: name -> spec, and frozenset of keys -> spec
+        self._schemas = {}
+        self._schema_by_keys = {}
+
+    @property
+    def key_prefix(self):
+        return self._key_prefix
+
+    @key_prefix.setter
+    def key_prefix(self, value):
+        # Encoded once per change; _k runs on every get/set
+        self._key_prefix = value
+        self._prefix_b = self._pb(value)
 
     # ---- lifecycle ----
     def open(self):
@@ -129,61 +184,169 @@ class BTreeDB:
     def __exit__(self, exc_type, exc, tb):
         self.close()
 
+    def bulk(self):
+        """Batch writes: `with db.bulk(): ...` suspends autosync and flushes once on exit."""
+        return _Bulk(self)
+
     # ---- key/value helpers ----
+    @staticmethod
+    def _pb(prefix):
+        # Encoded prefix including the ':' separator (b"" for no prefix)
+        if not prefix:
+            return b""
+        if not isinstance(prefix, bytes):
+            prefix = str(prefix).encode('utf-8')
+        return prefix + b":"
+
     def _k(self, key, prefix=None):
-        if isinstance(key, bytes):
-            kb = key
-        else:
-            # accept int/str
-            kb = str(key).encode('utf-8')
-        p = prefix if prefix is not None else self.key_prefix
-        if p:
-            if not isinstance(p, bytes):
-                p = str(p).encode('utf-8')
-            return p + b":" + kb
-        return kb
-
-    @classmethod
-    def _enc(cls, value):
+        pb = self._prefix_b if prefix is None else self._pb(prefix)
+        # accept bytes/int/str
+        return pb + (key if isinstance(key, bytes) else str(key).encode('utf-8'))
+
+    def register_schema(self, name, fields):
+        """Register a fixed layout for flat records so they are stored packed.
+
+        `fields` is a sequence of (field_name, struct_code) pairs, e.g.
+        [('d_mm', 'f'), ('n', 'H'), ('grade', '8s')]. Supported codes are the
+        integer codes (b B h H i I l L q Q), 'f'/'d' and 'Ns' strings. Any dict
+        with exactly these keys (in any order) is then written with `struct`
+        instead of JSON and decodes back to a dict of the same keys.
+        None is allowed in every field (kept in a presence bitmask). A record
+        that does not fit (wrong type, int out of range, string longer than
+        its width or containing NUL, or a bool) is stored as JSON instead.
+        The same schema must be registered to read packed records back.
+        """
+        nb = name.encode('utf-8') if isinstance(name, str) else bytes(name)
+        if not 0 < len(nb) < 256:
+            raise ValueError("Schema name must be 1..255 bytes")
+        names = []
+        kinds = []
+        for fname, code in fields:
+            c = code[-1:]
+            if c == 's':
+                kinds.append(('s', int(code[:-1] or 1)))
+            elif len(code) == 1 and c in _INT_RANGES:
+                kinds.append(('i', _INT_RANGES[c]))
+            elif len(code) == 1 and c in ('f', 'd'):
+                kinds.append(('f', None))
+            else:
+                raise ValueError("Unsupported field code: {}".format(code))
+            names.append(fname)
+        names = tuple(names)
+        spec = (
+            nb,
+            names,
+            tuple(kinds),
+            # Format string, not struct.Struct: ustruct has no Struct class
+            '<' + ''.join(code for _, code in fields),
+            (len(names) + 7) // 8,
+        )
+        self._schemas[nb] = spec
+        # Matched by key set: dict order is not guaranteed on MicroPython
+        self._schema_by_keys[frozenset(names)] = spec
+
+    def _pack(self, spec, value):
+        nb, names, kinds, fmt, mask_len = spec
+        mask = bytearray(mask_len)
+        vals = []
+        for i, n in enumerate(names):
+            v = value[n]
+            kind, arg = kinds[i]
+            if v is None:
+                # Absent: bit stays clear, placeholder keeps the layout fixed
+                v = 0.0 if kind == 'f' else (b'' if kind == 's' else 0)
+            else:
+                mask[i >> 3] |= 1 << (i & 7)
+                if isinstance(v, bool):
+                    # would read back as 1/1.0; keep True/False via JSON
+                    return None
+                if kind == 'f':
+                    if not isinstance(v, (int, float)):
+                        return None
+                elif kind == 'i':
+                    # ustruct wraps out-of-range ints silently, so check here
+                    if not isinstance(v, int) or not arg[0] <= v <= arg[1]:
+                        return None
+                else:
+                    if not isinstance(v, str):
+                        return None
+                    v = v.encode('utf-8')
+                    # Would be truncated (or lose NUL-padding boundaries)
+                    if len(v) > arg or b'\0' in v:
+                        return None
+            vals.append(v)
+        try:
+            body = struct.pack(fmt, *vals)
+        except (_STRUCT_ERROR, TypeError, ValueError, OverflowError):
+            return None
+        return self._T_PACK + bytes((len(nb),)) + nb + bytes(mask) + body
+
+    def _unpack(self, body):
+        n = body[0]
+        name = body[1:1 + n]
+        spec = self._schemas.get(name)
+        if spec is None:
+            raise ValueError("Unknown packed schema: {}".format(name))
+        _, names, kinds, fmt, mask_len = spec
+        mask = body[1 + n:1 + n + mask_len]
+        out = {}
+        for i, v in enumerate(struct.unpack(fmt, body[1 + n + mask_len:])):
+            if not mask[i >> 3] & (1 << (i & 7)):
+                v = None
+            elif kinds[i][0] == 's':
+                v = v.rstrip(b'\0').decode('utf-8')
+            out[names[i]] = v
+        return out
+
+    def _enc(self, value):
         # Encode supported types into tagged bytes
         if isinstance(value, bool):
             # Store bool as int to avoid ambiguity
-            return cls._T_INT + (b"1" if value else b"0")
+            return self._T_INT + (b"1" if value else b"0")
         if isinstance(value, int):
-            return cls._T_INT + str(value).encode('utf-8')
+            return self._T_INT + str(value).encode('utf-8')
         if isinstance(value, float):
-            # Use repr for consistent round-trip
-            return cls._T_FLOAT + repr(value).encode('utf-8')
+            # Exact round-trip in 8 bytes, no text formatting/parsing
+            return self._T_FLOAT + struct.pack(_FLOAT_FMT, value)
         if isinstance(value, str):
-            return cls._T_STR + value.encode('utf-8')
+            return self._T_STR + value.encode('utf-8')
         if isinstance(value, dict):
-            return cls._T_DICT + json.dumps(value).encode('utf-8')
+            if self._schema_by_keys:
+                spec = self._schema_by_keys.get(frozenset(value))
+                if spec is not None:
+                    packed = self._pack(spec, value)
+                    if packed is not None:
+                        return packed
+            return self._T_DICT + _json_mod().dumps(value).encode('utf-8')
         if isinstance(value, list):
-            return cls._T_LIST + json.dumps(value).encode('utf-8')
+            return self._T_LIST + _json_mod().dumps(value).encode('utf-8')
         if isinstance(value, tuple):
             # Serialize tuple as JSON array but keep tag to restore tuple
-            return cls._T_TUPLE + json.dumps(list(value)).encode('utf-8')
+            return self._T_TUPLE + _json_mod().dumps(list(value)).encode('utf-8')
         raise TypeError("Unsupported value type: {}".format(type(value)))
 
-    @classmethod
-    def _dec(cls, raw):
+    def _dec(self, raw):
         if not raw or len(raw) < 2 or raw[1:2] != b":":
             raise ValueError("Invalid encoded value")
         tag = raw[:2]
         body = raw[2:]
-        if tag == cls._T_INT:
+        if tag == self._T_INT:
             return int(body)
-        if tag == cls._T_FLOAT:
-            # body is ASCII repr of float
+        if tag == self._T_FLOAT:
+            return struct.unpack(_FLOAT_FMT, body)[0]
+        if tag == self._T_FLOAT_TXT:
+            # written by older versions: ASCII repr of float
             return float(body)
-        if tag == cls._T_STR:
+        if tag == self._T_STR:
             return body.decode('utf-8')
-        if tag == cls._T_DICT:
-            return json.loads(body.decode('utf-8'))
-        if tag == cls._T_LIST:
-            return json.loads(body.decode('utf-8'))
-        if tag == cls._T_TUPLE:
-            return tuple(json.loads(body.decode('utf-8')))
+        if tag == self._T_DICT:
+            return _json_mod().loads(body.decode('utf-8'))
+        if tag == self._T_LIST:
+            return _json_mod().loads(body.decode('utf-8'))
+        if tag == self._T_TUPLE:
+            return tuple(_json_mod().loads(body.decode('utf-8')))
+        if tag == self._T_PACK:
+            return self._unpack(body)
         raise ValueError("Unknown type tag: {}".format(tag))
 
     def _assert_open(self):
@@ -193,23 +356,14 @@ class BTreeDB:
     # ---- CRUD ----
     def exists(self, key, *, prefix=None):
         self._assert_open()
-        k = self._k(key, prefix)
-        try:
-            _ = self._db[k]  # type: ignore[index]
-            return True
-        except KeyError:
-            return False
+        return self._db.get(self._k(key, prefix)) is not None  # type: ignore[attr-defined]
 
     def create(self, key, value, *, prefix=None):
         """Insert only; raises if key exists."""
         self._assert_open()
         k = self._k(key, prefix)
-        try:
-            _ = self._db[k]  # type: ignore[index]
+        if self._db.get(k) is not None:  # type: ignore[attr-defined]
             raise KeyError("Key already exists: {}".format(key))
-        except KeyError:
-            # not present; good to insert
-            pass
         self._db[k] = self._enc(value)  # type: ignore[index]
         if self.autosync:
             self.flush()
@@ -245,9 +399,7 @@ class BTreeDB:
         self._assert_open()
         k = self._k(key, prefix)
         # Ensure exists to keep semantics consistent
-        try:
-            _ = self._db[k]  # type: ignore[index]
-        except KeyError:
+        if self._db.get(k) is None:  # type: ignore[attr-defined]
             raise KeyError("Key does not exist: {}".format(key))
         self._db[k] = self._enc(value)  # type: ignore[index]
         if self.autosync:
@@ -267,37 +419,49 @@ class BTreeDB:
             raise
 
     # ---- Type-safe getters ----
+    # Types are checked on the raw tag, so a mismatch is caught before decoding.
+    def _get_tagged(self, key, tags, dec, expected_type, prefix, default):
+        self._assert_open()
+        raw = self._db.get(self._k(key, prefix))  # type: ignore[attr-defined]
+        if raw is None:
+            if default is not None:
+                return default
+            raise KeyError(key)
+        if raw[:2] not in tags:
+            raise TypeError("Value for key '{}' is not {}".format(key, expected_type))
+        return dec(raw)
+
     def get_int(self, key, *, prefix=None, default=None):
-        return self.get(key, prefix=prefix, default=default, expected_type=int)
+        return self._get_tagged(key, (self._T_INT,), _dec_int, int, prefix, default)
 
     def get_float(self, key, *, prefix=None, default=None):
-        return self.get(key, prefix=prefix, default=default, expected_type=float)
+        return self._get_tagged(key, (self._T_FLOAT, self._T_FLOAT_TXT), self._dec,
+                                float, prefix, default)
 
     def get_str(self, key, *, prefix=None, default=None):
-        return self.get(key, prefix=prefix, default=default, expected_type=str)
+        return self._get_tagged(key, (self._T_STR,), _dec_str, str, prefix, default)
 
     def get_dict(self, key, *, prefix=None, default=None):
-        return self.get(key, prefix=prefix, default=default, expected_type=dict)
+        return self._get_tagged(key, (self._T_DICT, self._T_PACK), self._dec,
+                                dict, prefix, default)
 
     def get_list(self, key, *, prefix=None, default=None):
-        return self.get(key, prefix=prefix, default=default, expected_type=list)
+        return self._get_tagged(key, (self._T_LIST,), self._dec, list, prefix, default)
 
     def get_tuple(self, key, *, prefix=None, default=None):
-        return self.get(key, prefix=prefix, default=default, expected_type=tuple)
+        return self._get_tagged(key, (self._T_TUPLE,), self._dec, tuple, prefix, default)
 
     # ---- Iteration utilities ----
     def keys(self, *, prefix=None):
         """Iterate UTF‑8 decoded keys (optionally under a prefix)."""
         self._assert_open()
-        p = prefix if prefix is not None else self.key_prefix
-        if p is not None:
-            if not isinstance(p, bytes):
-                p = str(p).encode('utf-8')
-            p = p + b":"
-            it = self._db  # type: ignore[attr-defined]
-            for k in it:
-                if k.startswith(p):
-                    yield k[len(p):].decode('utf-8')
+        pb = self._prefix_b if prefix is None else self._pb(prefix)
+        if pb:
+            # Range scan [b"p:", b"p;") - ';' is the byte after ':' - so only
+            # keys under the prefix are visited (end key is exclusive).
+            n = len(pb)
+            for k in self._db.keys(pb, pb[:-1] + b";"):  # type: ignore[attr-defined]
+                yield k[n:].decode('utf-8')
         else:
             for k in self._db:  # type: ignore[attr-defined]
                 yield k.decode('utf-8')
@@ -310,23 +474,19 @@ class BTreeDB:
         """
         self._assert_open()
         inserted = updated = skipped = 0
+        db = self._db
+        pb = self._prefix_b if prefix is None else self._pb(prefix)
         for k, v in mapping.items():
-            kb = self._k(k, prefix)
-            exists = False
-            try:
-                _ = self._db[kb]  # type: ignore[index]
-                exists = True
-            except KeyError:
-                exists = False
-            if exists:
-                if overwrite:
-                    self._db[kb] = self._enc(v)  # type: ignore[index]
-                    updated += 1
-                else:
+            kb = pb + (k if isinstance(k, bytes) else str(k).encode('utf-8'))
+            # Stored values always carry a tag, so None means "absent"
+            if db.get(kb) is not None:  # type: ignore[attr-defined]
+                if not overwrite:
                     skipped += 1
+                    continue
+                updated += 1
             else:
-                self._db[kb] = self._enc(v)  # type: ignore[index]
                 inserted += 1
+            db[kb] = self._enc(v)  # type: ignore[index]
         if self.autosync:
             self.flush()
         return {'inserted': inserted, 'updated': updated, 'skipped': skipped}
@@ -335,38 +495,31 @@ class BTreeDB:
         """Ingest a list of dicts using `key_field` value as the DB key.
 
         Each item is stored as a dict value under the composed key.
+        Items without `key_field` are skipped and counted; `require_key` is
+        accepted for compatibility and has no effect.
         Returns stats dict including counts for missing-key and existing-key cases.
         """
         self._assert_open()
         inserted = updated = skipped_existing = missing_key = 0
+        db = self._db
+        pb = self._prefix_b if prefix is None else self._pb(prefix)
         for item in items:
             if not isinstance(item, dict):
                 # Skip non-dicts to keep function robust.
                 continue
             if key_field not in item:
                 missing_key += 1
-                if require_key:
-                    # Strict mode: skip but count
-                    continue
-                # If not required, generate a key from index-like growth (not stored here to keep API simple)
                 continue
             key = item[key_field]
-            kb = self._k(key, prefix)
-            exists = False
-            try:
-                _ = self._db[kb]  # type: ignore[index]
-                exists = True
-            except KeyError:
-                exists = False
-            if exists:
-                if overwrite:
-                    self._db[kb] = self._enc(item)  # type: ignore[index]
-                    updated += 1
-                else:
+            kb = pb + (key if isinstance(key, bytes) else str(key).encode('utf-8'))
+            if db.get(kb) is not None:  # type: ignore[attr-defined]
+                if not overwrite:
                     skipped_existing += 1
+                    continue
+                updated += 1
             else:
-                self._db[kb] = self._enc(item)  # type: ignore[index]
                 inserted += 1
+            db[kb] = self._enc(item)  # type: ignore[index]
         if self.autosync:
             self.flush()
         return {
@@ -375,3 +528,52 @@ class BTreeDB:
             'skipped_existing': skipped_existing,
             'missing_key': missing_key,
         }
+
+    def ingest_list_presorted(self, items, key_field, *, prefix=None, sort=True):
+        """Fast bulk load of a list of dicts into a fresh (or disposable) namespace.
+
+        Unlike `ingest_list`, no existence probe is made: every item is written,
+        overwriting any existing value. Items are written in key order so btree
+        pages fill sequentially; pass sort=False if `items` is already sorted by
+        key. Every item must contain `key_field` (KeyError otherwise).
+        Flushes once at the end and returns the number of items written.
+        """
+        self._assert_open()
+        pb = self._prefix_b if prefix is None else self._pb(prefix)
+        enc = self._enc
+        db = self._db
+        if not sort:
+            # Already in key order: write straight through, no staging list
+            n = 0
+            for it in items:
+                key = it[key_field]
+                db[pb + (key if isinstance(key, bytes) else str(key).encode('utf-8'))] = enc(it)  # type: ignore[index]
+                n += 1
+            self.flush()
+            return n
+        rows = []
+        for it in items:
+            key = it[key_field]
+            rows.append((pb + (key if isinstance(key, bytes) else str(key).encode('utf-8')), it))
+        rows.sort(key=lambda r: r[0])
+        for kb, it in rows:
+            db[kb] = enc(it)  # type: ignore[index]
+        self.flush()
+        return len(rows)
+
+
+class _Bulk:
+    # Context manager behind BTreeDB.bulk(); a class because MicroPython
+    # builds often lack contextlib.
+    def __init__(self, db):
+        self._db = db
+        self._prev = db.autosync
+
+    def __enter__(self):
+        self._prev = self._db.autosync
+        self._db.autosync = False
+        return self._db
+
+    def __exit__(self, exc_type, exc, tb):
+        self._db.autosync = self._prev
+        self._db.flush()
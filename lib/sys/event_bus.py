@@ -1,15 +1,22 @@
 # lib/sys/event_bus.py
 # Event bus for event-driven architecture
 
+try:
+    from ucollections import deque
+except ImportError:  # desktop fallback
+    from collections import deque
+
 class EventBus:
     def __init__(self, maxlen=64):
-        pass
+        # Bounded FIFO: O(1) put/get, oldest events dropped when full
+        self._q = deque((), maxlen)
 
     def put(self, event):
-        pass
+        self._q.append(event)
 
     def get(self):
-        pass
+        """Pop the oldest event, or None if the queue is empty."""
+        return self._q.popleft() if self._q else None
 
     def has_event(self):
-        return False 
\ No newline at end of file
+        return bool(self._q)
@@ -1,12 +1,13 @@
-import json
 from lib.sys.db import BTreeDB
 
 
 def ingest_json_db(json_file, key_field='designation', prefix='steel'):
+    import json  # deferred: only needed when ingesting
     with open(json_file, 'r') as f:
         rows = json.load(f)
         
-    with BTreeDB('data.db') as db:
-        stats = db.ingest_list(rows, key_field, prefix)
+    # bulk(): no per-write autosync flushes, one flush at the end
+    with BTreeDB('data.db') as db, db.bulk():
+        stats = db.ingest_list(rows, key_field, prefix=prefix)
         print(stats)
 
@@ -0,0 +1,48 @@
+# tests/fake_btree.py
+# Minimal in-memory stand-in for MicroPython `btree` so BTreeDB runs on CPython
+
+_dbs = {}
+
+class _FakeDB:
+    def __init__(self):
+        self.data = {}
+        self.flushes = 0
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, bytes) or not isinstance(value, bytes):
+            raise TypeError("btree keys and values must be bytes")
+        self.data[key] = value
+
+    def __delitem__(self, key):
+        del self.data[key]
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(sorted(self.data))
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def keys(self, start_key=None, end_key=None, flags=0):
+        # end_key is exclusive, as in btree's default flags
+        for k in sorted(self.data):
+            if start_key is not None and k < start_key:
+                continue
+            if end_key is not None and k >= end_key:
+                break
+            yield k
+
+    def flush(self):
+        self.flushes += 1
+
+    def close(self):
+        pass
+
+def open(stream, *args, **kwargs):
+    # One database per file path, so reopening sees earlier writes
+    return _dbs.setdefault(stream.name, _FakeDB())
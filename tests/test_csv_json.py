@@ -0,0 +1,79 @@
+import importlib.util
+import io
+import math
+import os
+import unittest
+
+# csv-json.py has a hyphen in its name, so load it by path
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "csv-json.py")
+_spec = importlib.util.spec_from_file_location("csv_json", _PATH)
+csv_json = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(csv_json)
+
+CSV = (
+    "\ufeffDescription,Weight,d,bf,tf,tw,r1,Ag,Ix,Zx,Sx,rx,Iy,Zy,Sy,ry\n"
+    "\n"
+    ",kg/m,mm,mm,mm,mm,mm,mm2,x10^6 mm4,x10³ mm³,mm³,mm,x10? mm?,x10^3 mm3,x10^3 mm3,mm\n"
+    "310UC158 (G300),158,327,311,25.0,15.7,16.5,20100,388,2370,2680,139,125,807,1230,78.9\n"
+    "200 PFC,22.9,200\n"
+    "\n"
+)
+
+class TestSectionsCsv(unittest.TestCase):
+    def test_known_record(self):
+        rec = csv_json.sections_csv_to_schema(CSV)[0]
+        self.assertEqual((rec["designation"], rec["type"]), ("310UC158", "UC"))
+        self.assertEqual(rec["dimensions"],
+                         {"d_mm": 327, "bf_mm": 311, "tf_mm": 25.0, "tw_mm": 15.7, "r_mm": 16.5})
+        props = rec["properties"]
+        self.assertEqual(props["mass_kg_per_m"], 158)
+        self.assertEqual(props["area_mm2"], 20100)
+        self.assertEqual(props["Ix_mm4"], 388 * 10 ** 6)
+        self.assertEqual(props["Zx_mm3"], 2370 * 10 ** 3)
+        self.assertEqual(props["Sx_mm3"], 2680 * 1e3)  # exponent lost: header heuristic
+        self.assertEqual(props["Iy_mm4"], 125 * 1e6)   # corrupted 'x10?' unit
+        self.assertEqual(props["ry_mm"], 78.9)
+        self.assertEqual(rec["source"], "Australian Steel Standards")
+        self.assertIn("extracted_at", rec["raw_data"])
+
+    def test_row_parser_reused_for_same_layout(self):
+        csv_json._ROW_FN_CACHE.clear()
+        csv_json.sections_csv_to_schema(CSV)
+        fns = list(csv_json._ROW_FN_CACHE.values())
+        other = CSV.replace("310UC158 (G300),158", "250UC89.5 (G300),89.5")
+        rec = csv_json.sections_csv_to_schema(other)[0]
+        self.assertEqual(len(fns), 1)
+        self.assertEqual(list(csv_json._ROW_FN_CACHE.values()), fns)
+        self.assertEqual((rec["designation"], rec["properties"]["mass_kg_per_m"]), ("250UC89.5", 89.5))
+
+    def test_short_row_reads_none(self):
+        rec = csv_json.sections_csv_to_schema(CSV)[1]
+        self.assertEqual((rec["designation"], rec["type"]), ("200 PFC", "PFC"))
+        self.assertEqual(rec["dimensions"]["d_mm"], 200)
+        self.assertIsNone(rec["dimensions"]["bf_mm"])
+        self.assertIsNone(rec["properties"]["Ix_mm4"])
+
+    def test_long_row_ignores_extra_cells(self):
+        text = "Description,d\n,mm\n100UB,100,999,888\n"
+        rec = csv_json.sections_csv_to_schema(text)[0]
+        self.assertEqual(rec["dimensions"]["d_mm"], 100)
+
+    def test_requires_three_rows(self):
+        with self.assertRaises(ValueError):
+            csv_json.sections_csv_to_schema("Description,d\n\n,mm\n\n")
+
+    def test_file_object_input(self):
+        self.assertEqual(csv_json.sections_csv_to_schema(io.StringIO(CSV)),
+                         csv_json.sections_csv_to_schema(CSV))
+        self.assertEqual(len(list(csv_json.iter_sections_csv_to_schema(io.StringIO(CSV)))), 2)
+
+    def test_soa_nan_for_missing(self):
+        soa = csv_json.sections_csv_to_soa(CSV)
+        self.assertEqual(soa["designations"], ["310UC158", "200 PFC"])
+        self.assertEqual(soa["type"], ["UC", "PFC"])
+        self.assertEqual(soa["Ix_mm4"][0], 388e6)
+        self.assertEqual(soa["d_mm"][1], 200.0)
+        self.assertTrue(math.isnan(soa["Ix_mm4"][1]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from tests import fake_btree
+sys.modules.setdefault("btree", fake_btree)
+
+from lib.sys.db import BTreeDB
+
+class TestBTreeDB(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "test.db")
+        self.db = BTreeDB(self.path).open()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_create_and_update(self):
+        self.db.create("k", 1)
+        with self.assertRaises(KeyError):
+            self.db.create("k", 2)
+        with self.assertRaises(KeyError):
+            self.db.update("missing", 1)
+        self.db.update("k", 3)
+        self.assertEqual(self.db.get_int("k"), 3)
+        self.assertTrue(self.db.exists("k"))
+        self.assertFalse(self.db.exists("missing"))
+
+    def test_scalar_round_trip(self):
+        self.db.set("i", 5)
+        self.db.set("f", 0.1)
+        self.db.set("s", "hé")
+        self.db.set("t", (1, 2))
+        self.assertEqual(self.db.get_int("i"), 5)
+        self.assertEqual(self.db.get_float("f"), 0.1)
+        self.assertEqual(self.db.get_str("s"), "hé")
+        self.assertEqual(self.db.get_tuple("t"), (1, 2))
+        self.assertEqual(self.db._db[b"f"][:2], b"F:")
+
+    def test_legacy_text_float(self):
+        self.db._db[b"old"] = b"f:2.5"
+        self.assertEqual(self.db.get_float("old"), 2.5)
+        self.assertEqual(self.db.get("old"), 2.5)
+
+    def test_typed_getters_check_tag(self):
+        self.db.set("f", 1.5)
+        self.db.set("l", [1])
+        with self.assertRaises(TypeError):
+            self.db.get_int("f")
+        with self.assertRaises(TypeError):
+            self.db.get_tuple("l")
+        with self.assertRaises(KeyError):
+            self.db.get_int("missing")
+        self.assertEqual(self.db.get_int("missing", default=3), 3)
+
+    def test_packed_round_trip(self):
+        self.db.register_schema("sec", [("d_mm", "d"), ("n", "H"), ("grade", "4s")])
+        rec = {"d_mm": None, "n": 7, "grade": "G300"}
+        self.db.set("a", rec)
+        self.assertEqual(self.db._db[b"a"][:2], b"p:")
+        self.assertEqual(self.db.get_dict("a"), rec)
+
+    def test_packed_none_and_nan(self):
+        self.db.register_schema("sec", [("d_mm", "d"), ("n", "H"), ("grade", "4s")])
+        rec = {"grade": "G300", "n": None, "d_mm": None}  # any key order
+        self.db.set("a", rec)
+        self.assertEqual(self.db._db[b"a"][:2], b"p:")
+        self.assertEqual(self.db.get_dict("a"), rec)
+        self.db.set("b", {"d_mm": float("nan"), "n": 7, "grade": None})
+        b = self.db.get_dict("b")
+        self.assertNotEqual(b["d_mm"], b["d_mm"])  # NaN kept, not None
+        self.assertEqual((b["n"], b["grade"]), (7, None))
+
+    def test_packed_fallback_to_json(self):
+        self.db.register_schema("sec", [("d_mm", "d"), ("n", "B"), ("grade", "4s")])
+        for rec in (
+            {"d_mm": 1.0, "n": 1, "grade": "G300XYZ"},  # too long
+            {"d_mm": 1.0, "n": 1, "grade": "ü é"},      # too long once encoded
+            {"d_mm": 1.0, "n": 1, "grade": "a\0b"},     # embedded NUL
+            {"d_mm": 1.0, "n": 256, "grade": "x"},      # int out of range
+            {"d_mm": 1.0, "n": 1.5, "grade": "x"},      # float in int field
+            {"d_mm": True, "n": 1, "grade": "x"},       # bool in float field
+            {"d_mm": 1.0, "n": False, "grade": "x"},    # bool in int field
+        ):
+            self.db.set("r", rec)
+            self.assertEqual(self.db._db[b"r"][:2], b"d:")
+            self.assertEqual(self.db.get_dict("r"), rec)
+
+    def test_key_prefix_from_constructor(self):
+        with BTreeDB(self.path, key_prefix="app") as db:
+            db.set("x", 1)
+            db.set("y", 2, prefix="other")
+            self.assertIn(b"app:x", db._db)
+            self.assertIn(b"other:y", db._db)
+            self.assertEqual(db.get_int("x"), 1)
+
+    def test_key_prefix_change_applies(self):
+        with BTreeDB(self.path, key_prefix="a") as db:
+            db.key_prefix = "b"
+            db.set("k", 2)
+            self.assertIn(b"b:k", db._db)
+            self.assertEqual(list(db.keys()), ["k"])
+            db.key_prefix = None
+            db.set("k", 3)
+            self.assertIn(b"k", db._db)
+
+    def test_keys_prefix_excludes_siblings(self):
+        self.db.set("a", 1, prefix="steel")
+        self.db.set("b", 2, prefix="steel")
+        self.db.set("c", 3, prefix="steelx")
+        self.db.set("steel", 4)
+        self.assertEqual(sorted(self.db.keys(prefix="steel")), ["a", "b"])
+        self.assertEqual(list(self.db.keys(prefix="steelx")), ["c"])
+
+    def test_import_mapping_stats(self):
+        self.assertEqual(self.db.import_mapping({"A": 1, "B": 2}, prefix="n"),
+                         {"inserted": 2, "updated": 0, "skipped": 0})
+        self.assertEqual(self.db.import_mapping({"A": 5, "C": 3}, prefix="n", overwrite=False),
+                         {"inserted": 1, "updated": 0, "skipped": 1})
+        self.assertEqual(self.db.import_mapping({"A": 6}, prefix="n"),
+                         {"inserted": 0, "updated": 1, "skipped": 0})
+        self.assertEqual(self.db.get_int("A", prefix="n"), 6)
+
+    def test_ingest_list_stats(self):
+        rows = [{"id": "S235", "fy": 235.0}, {"id": "S355", "fy": 355.0}, {"fy": 1.0}, 5]
+        self.assertEqual(self.db.ingest_list(rows, "id", prefix="steel"),
+                         {"inserted": 2, "updated": 0, "skipped_existing": 0, "missing_key": 1})
+        self.assertEqual(self.db.ingest_list(rows[:1], "id", prefix="steel", overwrite=False),
+                         {"inserted": 0, "updated": 0, "skipped_existing": 1, "missing_key": 0})
+        self.assertEqual(self.db.get_dict("S355", prefix="steel"), rows[1])
+
+    def test_ingest_list_presorted(self):
+        rows = [{"id": "b"}, {"id": "a"}]
+        flushes = self.db._db.flushes
+        self.assertEqual(self.db.ingest_list_presorted(rows, "id", prefix="s"), 2)
+        self.assertEqual(self.db._db.flushes, flushes + 1)
+        self.assertEqual(list(self.db.keys(prefix="s")), ["a", "b"])
+
+    def test_ingest_list_presorted_streams_sorted_input(self):
+        rows = iter([{"id": "a"}, {"id": "b"}])
+        self.assertEqual(self.db.ingest_list_presorted(rows, "id", prefix="s", sort=False), 2)
+        self.assertEqual(self.db.get_dict("b", prefix="s"), {"id": "b"})
+
+    def test_bulk_restores_autosync_and_flushes_once(self):
+        self.db.autosync = True
+        flushes = self.db._db.flushes
+        with self.db.bulk():
+            self.assertFalse(self.db.autosync)
+            for i in range(5):
+                self.db.set(i, i)
+        self.assertTrue(self.db.autosync)
+        self.assertEqual(self.db._db.flushes, flushes + 1)
+
+    def test_json_imported_lazily(self):
+        # importing the db modules must not pull in json until a dict/list is stored
+        code = "import sys, lib.util.json_db; print('json' in sys.modules or 'ujson' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run([sys.executable, "-c", code], cwd=root,
+                             capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.strip(), "False")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,14 +8,21 @@ class TestEventBus(unittest.TestCase):
     def test_put_and_get(self):
         self.bus.put("event1")
         self.bus.put("event2")
-        # get() is a stub, so this will not return events yet
-        event = self.bus.get()
-        self.assertIsNone(event)
+        self.assertEqual(self.bus.get(), "event1")
+        self.assertEqual(self.bus.get(), "event2")
+        self.assertIsNone(self.bus.get())
 
     def test_has_event(self):
         self.assertFalse(self.bus.has_event())
         self.bus.put("event1")
-        self.assertFalse(self.bus.has_event())  # stub always returns False
+        self.assertTrue(self.bus.has_event())
+        self.bus.get()
+        self.assertFalse(self.bus.has_event())
+
+    def test_maxlen_drops_oldest(self):
+        for e in ("e1", "e2", "e3", "e4"):
+            self.bus.put(e)
+        self.assertEqual(self.bus.get(), "e2")
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file